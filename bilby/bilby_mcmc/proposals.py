@@ -9,7 +9,6 @@ from scipy.stats import gaussian_kde
 from ..core.prior import PriorDict
 from ..core.sampler.base_sampler import SamplerError
 from ..core.utils import logger, reflect
-from ..gw.source import PARAMETER_SETS
 
 
 class ProposalCycle(object):
@@ -969,6 +968,8 @@ def get_proposal_cycle(string, priors, L1steps=1, warn=True):
     tiny_weight = 0.1
 
     if "gwA" in string:
+        from ..gw.source import PARAMETER_SETS
+
         # Parameters for learning proposals
         learning_kwargs = dict(
             first_fit=1000, nsamples_for_density=10000, fit_multiplier=2
@@ -9,7 +9,6 @@ from ..prior import DeltaFunction, Sine, Cosine, PowerLaw, MultivariateGaussian
 from .base_sampler import MCMCSampler
 from ..likelihood import GaussianLikelihood, PoissonLikelihood, ExponentialLikelihood, \
     StudentTLikelihood
-from ...gw.likelihood import BasicGravitationalWaveTransient, GravitationalWaveTransient
 
 
 class Pymc3(MCMCSampler):
@@ -685,6 +684,8 @@ class Pymc3(MCMCSampler):
         Convert any bilby likelihoods to PyMC3 distributions.
         """
 
+        from ...gw.likelihood import BasicGravitationalWaveTransient, GravitationalWaveTransient
+
         # create theano Op for the log likelihood if not using a predefined model
         pymc3, STEP_METHODS, floatX = self._import_external_sampler()
         theano, tt, as_op = self._import_theano()
@@ -1,6 +1,37 @@
-from . import (conversion, cosmology, detector, eos, likelihood, prior,
-               result, source, utils, waveform_generator)
-from .waveform_generator import WaveformGenerator
-from .likelihood import GravitationalWaveTransient
-from .detector import calibration
+import importlib
+import sys
 
+# Submodules and attributes are imported on first access (PEP 562) as most
+# of them pull in lalsimulation, astropy and scipy at import time.
+_SUBMODULES = {
+    "conversion", "cosmology", "detector", "eos", "likelihood", "prior",
+    "result", "source", "utils", "waveform_generator",
+}
+_ATTRIBUTES = dict(
+    WaveformGenerator=".waveform_generator",
+    GravitationalWaveTransient=".likelihood",
+    calibration=".detector",
+)
+__all__ = sorted(_SUBMODULES | set(_ATTRIBUTES))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(
+            "module {} has no attribute {}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported before Python 3.7
+    for _name in sorted(_SUBMODULES) + sorted(_ATTRIBUTES):
+        __getattr__(_name)
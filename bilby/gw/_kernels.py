@@ -0,0 +1,76 @@
+"""
+Low-level numerical kernels used in the gravitational-wave likelihoods.
+
+If numba is installed the kernels are just-in-time compiled on first use,
+otherwise an equivalent numpy implementation is used.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _compile(loop, fallback):
+    """
+    Compile a kernel with numba, numba is imported here as it is an optional
+    dependency. If numba is not installed the fallback is returned.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return fallback
+    return njit(cache=True, fastmath=True)(loop)
+
+
+def _dh_hh_numpy(data_real, data_imag, signal, weights):
+    """ Numpy implementation of :code:`dh_hh` used without numba """
+    d_inner_h = np.sum(np.conj(signal) * (data_real + 1j * data_imag) * weights)
+    h_inner_h = np.sum((signal.real ** 2 + signal.imag ** 2) * weights)
+    return d_inner_h, h_inner_h
+
+
+def _dh_hh_loop(data_real, data_imag, signal, weights):
+    d_inner_h_real = 0.
+    d_inner_h_imag = 0.
+    h_inner_h = 0.
+    for ii in range(len(weights)):
+        signal_real = signal[ii].real
+        signal_imag = signal[ii].imag
+        d_inner_h_real += (
+            signal_real * data_real[ii] + signal_imag * data_imag[ii]
+        ) * weights[ii]
+        d_inner_h_imag += (
+            signal_real * data_imag[ii] - signal_imag * data_real[ii]
+        ) * weights[ii]
+        h_inner_h += (
+            signal_real * signal_real + signal_imag * signal_imag
+        ) * weights[ii]
+    return d_inner_h_real + 1j * d_inner_h_imag, h_inner_h
+
+
+def dh_hh(data_real, data_imag, signal, weights):
+    """
+    Compute the noise-weighted inner products <h|d> and <h|h> in a single
+    pass over the frequency arrays.
+
+    Parameters
+    ==========
+    data_real: array_like
+        The real part of the frequency-domain strain data
+    data_imag: array_like
+        The imaginary part of the frequency-domain strain data
+    signal: array_like
+        The frequency-domain signal, this is complex conjugated
+    weights: array_like
+        The inner product weights 4 / (duration * PSD), see
+        :code:`bilby.gw.detector.Interferometer.inner_product_weights`
+
+    Returns
+    =======
+    d_inner_h: complex
+        The complex inner product between the signal and the data
+    h_inner_h: float
+        The optimal signal-to-noise ratio squared
+    """
+    kernel = _compile(_dh_hh_loop, _dh_hh_numpy)
+    return kernel(data_real, data_imag, signal, weights)
@@ -37,7 +37,10 @@ class Interferometer(object):
     minimum_frequency = PropertyAccessor('strain_data', 'minimum_frequency')
     maximum_frequency = PropertyAccessor('strain_data', 'maximum_frequency')
     frequency_mask = PropertyAccessor('strain_data', 'frequency_mask')
+    frequency_mask_indices = PropertyAccessor('strain_data', 'frequency_mask_indices')
     frequency_domain_strain = PropertyAccessor('strain_data', 'frequency_domain_strain')
+    frequency_domain_strain_real = PropertyAccessor('strain_data', 'frequency_domain_strain_real')
+    frequency_domain_strain_imag = PropertyAccessor('strain_data', 'frequency_domain_strain_imag')
     time_domain_strain = PropertyAccessor('strain_data', 'time_domain_strain')
 
     def __init__(self, name, power_spectral_density, minimum_frequency, maximum_frequency, length, latitude, longitude,
@@ -455,6 +458,45 @@ class Interferometer(object):
                 frequency_array=self.strain_data.frequency_array) *
             self.strain_data.window_factor)
 
+    @property
+    def inner_product_weights(self):
+        """ The weights 4 / (duration * PSD) of the noise-weighted inner product
+
+        The weights cover the frequencies between `frequency_mask_indices`
+        and are zero where the frequency mask is False. They are cached
+        until the PSD, frequency mask (including changes made in place),
+        window factor or duration change.
+
+        Returns
+        =======
+        array_like: An array of the weights
+        """
+        psd_array = self.power_spectral_density.get_power_spectral_density_array(
+            frequency_array=self.strain_data.frequency_array)
+        mask_version = self.strain_data._get_frequency_mask_version()
+        window_factor = self.strain_data.window_factor
+        duration = self.strain_data.duration
+        # created on first use as interferometers pickled by earlier
+        # versions of bilby do not have the cache
+        if not hasattr(self, '_inner_product_weights_cache'):
+            self._inner_product_weights_cache = dict()
+        cache = self._inner_product_weights_cache
+        if (
+            cache.get('power_spectral_density_array') is not psd_array
+            or cache.get('frequency_mask_version') != mask_version
+            or cache.get('window_factor') != window_factor
+            or cache.get('duration') != duration
+        ):
+            lower, upper = self.strain_data.frequency_mask_indices
+            sub_mask = self.strain_data.frequency_mask[lower:upper]
+            weights = np.zeros(upper - lower)
+            weights[sub_mask] = 4 / duration / (
+                psd_array[lower:upper][sub_mask] * window_factor)
+            cache.update(
+                power_spectral_density_array=psd_array, frequency_mask_version=mask_version,
+                window_factor=window_factor, duration=duration, weights=weights)
+        return cache['weights']
+
     def unit_vector_along_arm(self, arm):
         logger.warning("This method has been moved and will be removed in the future."
                        "Use Interferometer.geometry.unit_vector_along_arm instead.")
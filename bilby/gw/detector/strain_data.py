@@ -46,6 +46,9 @@ class InterferometerStrainData(object):
 
         self._frequency_mask_updated = False
         self._frequency_mask = None
+        self._frequency_mask_reference = None
+        self._frequency_mask_version = 0
+        self._frequency_mask_indices = None
         self._frequency_domain_strain = None
         self._time_domain_strain = None
         self._channel = None
@@ -159,6 +162,47 @@ class InterferometerStrainData(object):
         self._frequency_mask = mask
         self._frequency_mask_updated = True
 
+    def _get_frequency_mask_version(self):
+        """ A counter which is incremented whenever the frequency mask changes
+
+        Caches derived from the frequency mask compare this counter. The
+        mask is compared with a copy, rather than by identity, as the array
+        returned by `frequency_mask` can be modified in place.
+        """
+        mask = self.frequency_mask
+        # strain data pickled by earlier versions of bilby do not have these
+        reference = getattr(self, '_frequency_mask_reference', None)
+        if reference is None or not np.array_equal(mask, reference):
+            self._frequency_mask_reference = mask.copy()
+            self._frequency_mask_version = getattr(self, '_frequency_mask_version', 0) + 1
+        return self._frequency_mask_version
+
+    @property
+    def frequency_mask_indices(self):
+        """ Indices bounding the frequencies where the frequency mask is True.
+
+        Slicing with these indices gives contiguous views of the analysed
+        frequency band, frequencies inside the slice can still be excluded
+        from the mask, e.g., by notches.
+
+        Returns
+        =======
+        lower, upper: int
+            The first index where the mask is True and one past the last
+            index where the mask is True.
+        """
+        version = self._get_frequency_mask_version()
+        # strain data pickled by earlier versions of bilby do not have this
+        cached = getattr(self, '_frequency_mask_indices', None)
+        if cached is None or cached[0] != version:
+            idxs = np.flatnonzero(self.frequency_mask)
+            if len(idxs) == 0:
+                indices = (0, 0)
+            else:
+                indices = (int(idxs[0]), int(idxs[-1]) + 1)
+            self._frequency_mask_indices = (version, indices)
+        return self._frequency_mask_indices[1]
+
     @property
     def alpha(self):
         return 2 * self.roll_off / self.duration
@@ -232,9 +276,48 @@ class InterferometerStrainData(object):
     def frequency_domain_strain(self, frequency_domain_strain):
         if not len(self.frequency_array) == len(frequency_domain_strain):
             raise ValueError("The frequency_array and the set strain have different lengths")
-        self._frequency_domain_strain = frequency_domain_strain
+        # copied so changes to the input array can't make the cached
+        # real and imaginary parts stale
+        self._frequency_domain_strain = np.array(frequency_domain_strain)
         self._time_domain_strain = None
 
+    @property
+    def frequency_domain_strain_real(self):
+        """ The real part of the frequency domain strain
+
+        This is stored as a contiguous array and cached until the strain is
+        set or the frequency mask changes.
+        """
+        return self._get_frequency_domain_strain_parts()[0]
+
+    @property
+    def frequency_domain_strain_imag(self):
+        """ The imaginary part of the frequency domain strain
+
+        This is stored as a contiguous array and cached until the strain is
+        set or the frequency mask changes.
+        """
+        return self._get_frequency_domain_strain_parts()[1]
+
+    def _get_frequency_domain_strain_parts(self):
+        mask_version = self._get_frequency_mask_version()
+        # created on first use as strain data pickled by earlier versions of
+        # bilby do not have the cache
+        if not hasattr(self, '_frequency_domain_strain_parts'):
+            self._frequency_domain_strain_parts = dict()
+        cache = self._frequency_domain_strain_parts
+        if (
+            self._frequency_domain_strain is None
+            or cache.get('frequency_domain_strain') is not self._frequency_domain_strain
+            or cache.get('frequency_mask_version') != mask_version
+        ):
+            strain = self.frequency_domain_strain
+            cache.update(
+                frequency_domain_strain=self._frequency_domain_strain,
+                frequency_mask_version=mask_version, real=np.ascontiguousarray(strain.real),
+                imag=np.ascontiguousarray(strain.imag))
+        return cache['real'], cache['imag']
+
     def to_gwpy_timeseries(self):
         """
         Output the time series strain data as a :class:`gwpy.timeseries.TimeSeries`.
@@ -601,7 +684,9 @@ class InterferometerStrainData(object):
 
         logger.debug('Setting data using provided frequency_domain_strain')
         if np.shape(frequency_domain_strain) == np.shape(self.frequency_array):
-            self._frequency_domain_strain = frequency_domain_strain
+            # copied so changes to the input array can't make the cached
+            # real and imaginary parts stale
+            self._frequency_domain_strain = np.array(frequency_domain_strain)
             self.window_factor = 1
         else:
             raise ValueError("Data frequencies do not match frequency_array")
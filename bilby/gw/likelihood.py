@@ -13,13 +13,11 @@ from ..core.utils import (
     logger, UnsortedInterp2d, create_frequency_series, create_time_series,
     speed_of_light, radius_of_earth)
 from ..core.prior import Interped, Prior, Uniform, PriorDict, DeltaFunction
+from ._kernels import dh_hh
 from .detector import InterferometerList, get_empty_interferometer, calibration
 from .prior import BBHPriorDict, CBCPriorDict, Cosmological
 from .source import lal_binary_black_hole
-from .utils import (
-    noise_weighted_inner_product, build_roq_weights, zenith_azimuth_to_ra_dec,
-    ln_i0
-)
+from .utils import build_roq_weights, zenith_azimuth_to_ra_dec, ln_i0
 from .waveform_generator import WaveformGenerator
 from collections import namedtuple
 
@@ -252,8 +250,12 @@ class GravitationalWaveTransient(Likelihood):
         if 'recalib_index' in self.parameters:
             signal[_mask] *= self.calibration_draws[interferometer.name][int(self.parameters['recalib_index'])]
 
-        d_inner_h = interferometer.inner_product(signal=signal)
-        optimal_snr_squared = interferometer.optimal_snr_squared(signal=signal)
+        lower, upper = interferometer.frequency_mask_indices
+        data_real = interferometer.frequency_domain_strain_real
+        data_imag = interferometer.frequency_domain_strain_imag
+        d_inner_h, optimal_snr_squared = dh_hh(
+            data_real[lower:upper], data_imag[lower:upper],
+            signal[lower:upper], interferometer.inner_product_weights)
         complex_matched_filter_snr = d_inner_h / (optimal_snr_squared**0.5)
 
         d_inner_h_array = None
@@ -261,38 +263,40 @@ class GravitationalWaveTransient(Likelihood):
 
         if self.time_marginalization and self.calibration_marginalization:
 
-            d_inner_h_integrand = np.tile(
-                interferometer.frequency_domain_strain.conjugate() * signal /
-                interferometer.power_spectral_density_array, (self.number_of_response_curves, 1)).T
+            sub_mask = _mask[lower:upper]
+            d_inner_h_integrand = np.zeros(
+                (len(signal), self.number_of_response_curves), dtype=complex)
+            d_inner_h_integrand[_mask] = (
+                signal[lower:upper] *
+                (data_real[lower:upper] - 1j * data_imag[lower:upper]) *
+                interferometer.inner_product_weights)[sub_mask, np.newaxis] *\
+                self.calibration_draws[interferometer.name].T
 
-            d_inner_h_integrand[_mask] *= self.calibration_draws[interferometer.name].T
+            d_inner_h_array = np.fft.fft(d_inner_h_integrand[0:-1], axis=0).T
 
-            d_inner_h_array =\
-                4 / self.waveform_generator.duration * np.fft.fft(
-                    d_inner_h_integrand[0:-1], axis=0).T
-
-            optimal_snr_squared_integrand = 4. / self.waveform_generator.duration *\
-                np.abs(signal)**2 / interferometer.power_spectral_density_array
-            optimal_snr_squared_array = np.dot(optimal_snr_squared_integrand[_mask],
-                                               self.calibration_abs_draws[interferometer.name].T)
+            optimal_snr_squared_array = self._optimal_snr_squared_calibration_array(
+                signal, interferometer)
 
         elif self.time_marginalization and not self.calibration_marginalization:
-            d_inner_h_array =\
-                4 / self.waveform_generator.duration * np.fft.fft(
-                    signal[0:-1] *
-                    interferometer.frequency_domain_strain.conjugate()[0:-1] /
-                    interferometer.power_spectral_density_array[0:-1])
+            n_fft = len(signal) - 1
+            upper = min(upper, n_fft)
+            d_inner_h_integrand = np.zeros(n_fft, dtype=complex)
+            d_inner_h_integrand[lower:upper] = (
+                signal[lower:upper] *
+                (data_real[lower:upper] - 1j * data_imag[lower:upper]) *
+                interferometer.inner_product_weights[:upper - lower])
+            d_inner_h_array = np.fft.fft(d_inner_h_integrand)
 
         elif self.calibration_marginalization and ('recalib_index' not in self.parameters):
-            d_inner_h_integrand = 4. / self.waveform_generator.duration * \
-                interferometer.frequency_domain_strain.conjugate() * signal / \
-                interferometer.power_spectral_density_array
-            d_inner_h_array = np.dot(d_inner_h_integrand[_mask], self.calibration_draws[interferometer.name].T)
+            sub_mask = _mask[lower:upper]
+            d_inner_h_integrand = (
+                signal[lower:upper] *
+                (data_real[lower:upper] - 1j * data_imag[lower:upper]) *
+                interferometer.inner_product_weights)
+            d_inner_h_array = np.dot(d_inner_h_integrand[sub_mask], self.calibration_draws[interferometer.name].T)
 
-            optimal_snr_squared_integrand = 4. / self.waveform_generator.duration *\
-                np.abs(signal)**2 / interferometer.power_spectral_density_array
-            optimal_snr_squared_array = np.dot(optimal_snr_squared_integrand[_mask],
-                                               self.calibration_abs_draws[interferometer.name].T)
+            optimal_snr_squared_array = self._optimal_snr_squared_calibration_array(
+                signal, interferometer)
 
         return self._CalculatedSNRs(
             d_inner_h=d_inner_h, optimal_snr_squared=optimal_snr_squared,
@@ -301,6 +305,16 @@ class GravitationalWaveTransient(Likelihood):
             optimal_snr_squared_array=optimal_snr_squared_array,
             d_inner_h_squared_tc_array=None)
 
+    def _optimal_snr_squared_calibration_array(self, signal, interferometer):
+        """ Compute <h|h> for each of the calibration response curves """
+        lower, upper = interferometer.frequency_mask_indices
+        sub_mask = interferometer.frequency_mask[lower:upper]
+        signal = signal[lower:upper]
+        optimal_snr_squared_integrand = (
+            (signal.real ** 2 + signal.imag ** 2) * interferometer.inner_product_weights)
+        return np.dot(optimal_snr_squared_integrand[sub_mask],
+                      self.calibration_abs_draws[interferometer.name].T)
+
     def _check_marginalized_prior_is_set(self, key):
         if key in self.priors and self.priors[key].is_fixed:
             raise ValueError(
@@ -344,15 +358,28 @@ class GravitationalWaveTransient(Likelihood):
             self._prior = None
 
     def noise_log_likelihood(self):
+        """
+        The log likelihood of the data under the noise-only hypothesis.
+
+        This only depends on the data, so it is cached until the strain,
+        frequency mask or PSD of any of the interferometers change.
+        """
+        key = _interferometer_data_key(self.interferometers)
+        cache = self._noise_log_likelihood_cache
+        if not _same_interferometer_data(key, cache['key']):
+            cache.update(key=key, value=self._calculate_noise_log_likelihood())
+        return cache['value']
+
+    def _calculate_noise_log_likelihood(self):
         log_l = 0
         for interferometer in self.interferometers:
-            mask = interferometer.frequency_mask
-            log_l -= noise_weighted_inner_product(
-                interferometer.frequency_domain_strain[mask],
-                interferometer.frequency_domain_strain[mask],
-                interferometer.power_spectral_density_array[mask],
-                self.waveform_generator.duration) / 2
-        return float(np.real(log_l))
+            lower, upper = interferometer.frequency_mask_indices
+            data_real = interferometer.frequency_domain_strain_real[lower:upper]
+            data_imag = interferometer.frequency_domain_strain_imag[lower:upper]
+            log_l -= np.sum(
+                (data_real ** 2 + data_imag ** 2) *
+                interferometer.inner_product_weights) / 2
+        return float(log_l)
 
     def log_likelihood_ratio(self):
         waveform_polarizations =\
@@ -709,6 +736,16 @@ class GravitationalWaveTransient(Likelihood):
             return d_inner_h - h_inner_h / 2
 
     def time_marginalized_likelihood(self, d_inner_h_tc_array, h_inner_h):
+        times = self._times
+        if self.jitter_time:
+            times = self._times + self.parameters['time_jitter']
+        time_prior_array = self.priors['geocent_time'].prob(times) * self._delta_tc
+        in_prior = time_prior_array > 0
+        if not np.any(in_prior):
+            return -np.inf
+        d_inner_h_tc_array = d_inner_h_tc_array[in_prior]
+        time_prior_array = time_prior_array[in_prior]
+
         if self.distance_marginalization:
             log_l_tc_array = self.distance_marginalized_likelihood(
                 d_inner_h=d_inner_h_tc_array, h_inner_h=h_inner_h)
@@ -718,10 +755,6 @@ class GravitationalWaveTransient(Likelihood):
                 h_inner_h=h_inner_h)
         else:
             log_l_tc_array = np.real(d_inner_h_tc_array) - h_inner_h / 2
-        times = self._times
-        if self.jitter_time:
-            times = self._times + self.parameters['time_jitter']
-        time_prior_array = self.priors['geocent_time'].prob(times) * self._delta_tc
         return logsumexp(log_l_tc_array, b=time_prior_array)
 
     def time_and_calibration_marginalized_likelihood(self, d_inner_h_array, h_inner_h):
@@ -1024,6 +1057,7 @@ class GravitationalWaveTransient(Likelihood):
     @interferometers.setter
     def interferometers(self, interferometers):
         self._interferometers = InterferometerList(interferometers)
+        self._noise_log_likelihood_cache = dict(key=None, value=None)
 
     def _rescale_signal(self, signal, new_distance):
         for mode in signal:
@@ -1147,14 +1181,35 @@ class BasicGravitationalWaveTransient(Likelihood):
         return self.__class__.__name__ + '(interferometers={},\n\twaveform_generator={})'\
             .format(self.interferometers, self.waveform_generator)
 
+    @property
+    def interferometers(self):
+        return self._interferometers
+
+    @interferometers.setter
+    def interferometers(self, interferometers):
+        self._interferometers = interferometers
+        self._noise_log_likelihood_cache = dict(key=None, duration=None, value=None)
+
     def noise_log_likelihood(self):
         """ Calculates the real part of noise log-likelihood
 
+        This only depends on the data, so it is cached until the strain,
+        frequency mask or PSD of any of the interferometers change.
+
         Returns
         =======
         float: The real part of the noise log likelihood
 
         """
+        key = _interferometer_data_key(self.interferometers)
+        duration = self.waveform_generator.duration
+        cache = self._noise_log_likelihood_cache
+        if not _same_interferometer_data(key, cache['key']) or cache['duration'] != duration:
+            cache.update(
+                key=key, duration=duration, value=self._calculate_noise_log_likelihood())
+        return cache['value']
+
+    def _calculate_noise_log_likelihood(self):
         log_l = 0
         for interferometer in self.interferometers:
             log_l -= 2. / self.waveform_generator.duration * np.sum(
@@ -1688,6 +1743,30 @@ class ROQGravitationalWaveTransient(GravitationalWaveTransient):
                 signal[kind][mode] *= self._ref_dist / new_distance
 
 
+def _interferometer_data_key(interferometers):
+    """
+    The arrays identifying the data in each of the interferometers.
+
+    The real part of the strain and the inner product weights are rebuilt
+    whenever the strain is set (a copy of the input is stored), the frequency
+    mask changes (including in place), or the PSD, window factor or duration
+    change, so comparing their identities detects any change in the data.
+    """
+    return [
+        (interferometer.frequency_domain_strain_real,
+         interferometer.inner_product_weights)
+        for interferometer in interferometers
+    ]
+
+
+def _same_interferometer_data(key, other):
+    return other is not None and len(key) == len(other) and all(
+        new is old
+        for new_arrays, old_arrays in zip(key, other)
+        for new, old in zip(new_arrays, old_arrays)
+    )
+
+
 def get_binary_black_hole_likelihood(interferometers):
     """ A wrapper to quickly set up a likelihood for BBH parameter estimation
 
@@ -346,6 +346,41 @@ class TestInterferometer(unittest.TestCase):
             self.assertTrue(np.array_equal(expected[2], actual[2]))
             self.assertEqual(expected[3], actual[3])
 
+    def test_inner_product_weights(self):
+        lower, upper = self.ifo.frequency_mask_indices
+        mask = self.ifo.frequency_mask[lower:upper]
+        expected = 4 / self.ifo.duration / self.ifo.power_spectral_density_array[lower:upper]
+        weights = self.ifo.inner_product_weights
+        self.assertTrue(np.array_equal(weights[mask], expected[mask]))
+        self.assertTrue(np.all(weights[~mask] == 0))
+        self.assertIs(weights, self.ifo.inner_product_weights)
+
+    def test_inner_product_weights_updated_with_power_spectral_density(self):
+        weights = self.ifo.inner_product_weights
+        self.ifo.power_spectral_density = bilby.gw.detector.PowerSpectralDensity(
+            frequency_array=self.ifo.frequency_array,
+            psd_array=2 * self.ifo.power_spectral_density_array,
+        )
+        self.assertTrue(np.allclose(self.ifo.inner_product_weights, weights / 2))
+
+    def test_inner_product_weights_updated_with_frequency_mask_in_place(self):
+        lower, upper = self.ifo.frequency_mask_indices
+        weights = self.ifo.inner_product_weights
+        self.assertTrue(np.all(weights[5:10] > 0))
+        self.ifo.strain_data.frequency_mask[lower + 5:lower + 10] = False
+        self.assertEqual((lower, upper), self.ifo.frequency_mask_indices)
+        self.assertTrue(np.all(self.ifo.inner_product_weights[5:10] == 0))
+        self.assertTrue(np.array_equal(
+            self.ifo.inner_product_weights[10:], weights[10:]
+        ))
+
+    def test_inner_product_weights_without_caches(self):
+        """Interferometers pickled by earlier versions don't have the caches"""
+        expected = self.ifo.inner_product_weights.copy()
+        del self.ifo._inner_product_weights_cache
+        del self.ifo.strain_data._frequency_mask_indices
+        self.assertTrue(np.array_equal(self.ifo.inner_product_weights, expected))
+
     def test_repr(self):
         expected = (
             "Interferometer(name='{}', power_spectral_density={}, minimum_frequency={}, "
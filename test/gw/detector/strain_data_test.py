@@ -78,6 +78,95 @@ class TestInterferometerStrainData(unittest.TestCase):
         idxs = (freqs > 100) * (freqs < 101)
         self.assertTrue(len(freqs[idxs]) == 0)
 
+    def test_frequency_mask_indices(self):
+        strain_data = bilby.gw.detector.InterferometerStrainData(
+            minimum_frequency=20, maximum_frequency=512, notch_list=[(100, 101)])
+        strain_data.set_from_time_domain_strain(
+            time_domain_strain=np.random.normal(0, 1, 4096),
+            time_array=np.arange(0, 4, 4 / 4096)
+        )
+        lower, upper = strain_data.frequency_mask_indices
+        self.assertEqual(
+            np.sum(strain_data.frequency_mask), np.sum(strain_data.frequency_mask[lower:upper])
+        )
+        self.assertTrue(strain_data.frequency_mask[lower])
+        self.assertTrue(strain_data.frequency_mask[upper - 1])
+
+        # Test from update
+        strain_data.maximum_frequency = 256
+        lower, upper = strain_data.frequency_mask_indices
+        self.assertTrue(strain_data.frequency_mask[upper - 1])
+        self.assertFalse(strain_data.frequency_mask[upper])
+
+    def test_frequency_mask_indices_updated_with_mask_in_place(self):
+        strain_data = bilby.gw.detector.InterferometerStrainData(
+            minimum_frequency=20, maximum_frequency=512)
+        strain_data.set_from_time_domain_strain(
+            time_domain_strain=np.random.normal(0, 1, 4096),
+            time_array=np.arange(0, 4, 4 / 4096)
+        )
+        lower, upper = strain_data.frequency_mask_indices
+        strain_data.frequency_mask[lower:lower + 10] = False
+        strain_data.frequency_mask[upper - 10:upper] = False
+        self.assertEqual((lower + 10, upper - 10), strain_data.frequency_mask_indices)
+
+    def test_frequency_domain_strain_real_and_imag(self):
+        strain_data = bilby.gw.detector.InterferometerStrainData(
+            minimum_frequency=20, maximum_frequency=512)
+        strain_data.set_from_time_domain_strain(
+            time_domain_strain=np.random.normal(0, 1, 4096),
+            time_array=np.arange(0, 4, 4 / 4096)
+        )
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_real, strain_data.frequency_domain_strain.real
+        ))
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_imag, strain_data.frequency_domain_strain.imag
+        ))
+
+        # Test from update
+        strain_data.frequency_domain_strain = 2 * strain_data.frequency_domain_strain
+        strain_data.maximum_frequency = 256
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_real, strain_data.frequency_domain_strain.real
+        ))
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_imag, strain_data.frequency_domain_strain.imag
+        ))
+
+    def test_frequency_domain_strain_real_and_imag_with_data_changed_in_place(self):
+        strain_data = bilby.gw.detector.InterferometerStrainData(
+            minimum_frequency=20, maximum_frequency=512)
+        frequency_array = np.linspace(0, 1024, 4097)
+        data = np.random.normal(0, 1, 4097) + 1j * np.random.normal(0, 1, 4097)
+        strain_data.set_from_frequency_domain_strain(
+            frequency_domain_strain=data, frequency_array=frequency_array
+        )
+        strain_data.frequency_domain_strain_real
+        data *= 2
+        strain_data.frequency_mask[1000:1010] = False
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_real, strain_data.frequency_domain_strain.real
+        ))
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain_imag, strain_data.frequency_domain_strain.imag
+        ))
+        self.assertTrue(np.array_equal(
+            strain_data.frequency_domain_strain, data / 2 * strain_data.frequency_mask
+        ))
+
+    def test_frequency_domain_strain_real_and_imag_without_cache(self):
+        """Strain data pickled by earlier versions doesn't have the cache"""
+        strain_data = bilby.gw.detector.InterferometerStrainData(
+            minimum_frequency=20, maximum_frequency=512)
+        strain_data.set_from_time_domain_strain(
+            time_domain_strain=np.random.normal(0, 1, 4096),
+            time_array=np.arange(0, 4, 4 / 4096)
+        )
+        expected = strain_data.frequency_domain_strain_real.copy()
+        del strain_data._frequency_domain_strain_parts
+        self.assertTrue(np.array_equal(strain_data.frequency_domain_strain_real, expected))
+
     def test_set_data_fails(self):
         with mock.patch("bilby.core.utils.create_frequency_series") as m:
             m.return_value = [1, 2, 3]
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import types
+import unittest
+
+import bilby
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_submodules_not_imported_with_bilby(self):
+        code = (
+            "import sys, bilby; "
+            "print(sorted(m for m in sys.modules if m.startswith('bilby.gw.')))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.decode().strip().splitlines()[-1], "[]")
+
+    def test_submodule_access(self):
+        for name in bilby.gw._SUBMODULES:
+            module = getattr(bilby.gw, name)
+            self.assertIsInstance(module, types.ModuleType)
+            self.assertEqual(module.__name__, "bilby.gw.{}".format(name))
+
+    def test_attribute_access(self):
+        self.assertIs(
+            bilby.gw.WaveformGenerator,
+            bilby.gw.waveform_generator.WaveformGenerator,
+        )
+        self.assertIs(
+            bilby.gw.GravitationalWaveTransient,
+            bilby.gw.likelihood.GravitationalWaveTransient,
+        )
+        self.assertIs(bilby.gw.calibration, bilby.gw.detector.calibration)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            bilby.gw.not_a_submodule
+
+    def test_dir(self):
+        names = dir(bilby.gw)
+        for name in bilby.gw.__all__:
+            self.assertIn(name, names)
+
+    def test_star_import(self):
+        namespace = dict()
+        exec("from bilby.gw import *", namespace)
+        for name in ["conversion", "detector", "likelihood", "WaveformGenerator"]:
+            self.assertIn(name, namespace)
+        self.assertNotIn("importlib", namespace)
+        self.assertNotIn("sys", namespace)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+import bilby
+from bilby.gw import _kernels
+from bilby.gw.utils import noise_weighted_inner_product
+
+
+class TestDhHh(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(10)
+        self.ifo = bilby.gw.detector.get_empty_interferometer("H1")
+        self.ifo.strain_data.notch_list = [(60, 62), (119, 121)]
+        self.ifo.set_strain_data_from_power_spectral_density(
+            sampling_frequency=2048, duration=4
+        )
+        self.signal = (
+            np.random.normal(0, 1, len(self.ifo.frequency_array))
+            + 1j * np.random.normal(0, 1, len(self.ifo.frequency_array))
+        ) * self.ifo.amplitude_spectral_density_array
+        lower, upper = self.ifo.frequency_mask_indices
+        self.args = (
+            self.ifo.frequency_domain_strain_real[lower:upper],
+            self.ifo.frequency_domain_strain_imag[lower:upper],
+            self.signal[lower:upper],
+            self.ifo.inner_product_weights,
+        )
+        mask = self.ifo.frequency_mask
+        psd = self.ifo.power_spectral_density_array[mask]
+        self.expected_d_inner_h = noise_weighted_inner_product(
+            self.signal[mask], self.ifo.frequency_domain_strain[mask], psd,
+            self.ifo.duration,
+        )
+        self.expected_h_inner_h = noise_weighted_inner_product(
+            self.signal[mask], self.signal[mask], psd, self.ifo.duration
+        ).real
+
+    def tearDown(self):
+        del self.ifo
+        del self.signal
+        del self.args
+
+    def _check(self, kernel):
+        d_inner_h, h_inner_h = kernel(*self.args)
+        self.assertAlmostEqual(d_inner_h.real / self.expected_d_inner_h.real, 1, 10)
+        self.assertAlmostEqual(d_inner_h.imag / self.expected_d_inner_h.imag, 1, 10)
+        self.assertAlmostEqual(h_inner_h / self.expected_h_inner_h, 1, 10)
+
+    def test_notches_are_excluded(self):
+        self.assertGreater(
+            self.ifo.frequency_mask[slice(*self.ifo.frequency_mask_indices)].size,
+            np.sum(self.ifo.frequency_mask),
+        )
+
+    def test_loop(self):
+        self._check(_kernels._dh_hh_loop)
+
+    def test_numpy(self):
+        self._check(_kernels._dh_hh_numpy)
+
+    def test_dh_hh(self):
+        self._check(_kernels.dh_hh)
+
+
+if __name__ == "__main__":
+    unittest.main()